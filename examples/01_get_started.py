@@ -9,49 +9,37 @@ Prerequisites:
     cp .env.example .env   # fill in your credentials
 """
 
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
 from havona_sdk import HavonaClient, HavonaError
 
-# ------------------------------------------------------------------
-# Option A: username + password (interactive user)
-# ------------------------------------------------------------------
-client = HavonaClient.from_credentials(
-    base_url=os.environ["HAVONA_API_URL"],
-    auth0_domain=os.environ["AUTH0_DOMAIN"],
-    auth0_audience=os.environ["AUTH0_AUDIENCE"],
-    auth0_client_id=os.environ["AUTH0_CLIENT_ID"],
-    username=os.environ["HAVONA_EMAIL"],
-    password=os.environ["HAVONA_PASSWORD"],
-)
+# from_env() picks the right auth flow from the environment:
+# HAVONA_TOKEN, HAVONA_EMAIL/HAVONA_PASSWORD, or AUTH0_M2M_CLIENT_SECRET.
+# load_env=True also reads a local .env (skip it where env is already set).
+client = HavonaClient.from_env(load_env=True)
 
-# ------------------------------------------------------------------
-# Option B: M2M service account (uncomment to use)
-# ------------------------------------------------------------------
-# client = HavonaClient.from_m2m(
-#     base_url=os.environ["HAVONA_API_URL"],
-#     auth0_domain=os.environ["AUTH0_DOMAIN"],
-#     auth0_audience=os.environ["AUTH0_AUDIENCE"],
-#     auth0_client_id=os.environ["AUTH0_M2M_CLIENT_ID"],
-#     auth0_client_secret=os.environ["AUTH0_M2M_CLIENT_SECRET"],
-# )
+# The three reads below are independent, so we submit them all up front:
+# the pooled session overlaps their round-trips and total latency becomes
+# the slowest request instead of the sum of all three.
 
-# ------------------------------------------------------------------
-# Option C: inject a pre-obtained token (uncomment to use)
-# ------------------------------------------------------------------
-# client = HavonaClient.from_token(
-#     base_url=os.environ["HAVONA_API_URL"],
-#     token=os.environ["HAVONA_TOKEN"],
-# )
+from concurrent.futures import ThreadPoolExecutor
+
+executor = ThreadPoolExecutor(max_workers=3)
+status_future = executor.submit(client.blockchain.status)
+trades_future = executor.submit(client.trades.list, limit=10)
+graphql_future = executor.submit(client.graphql, """
+    query {
+        queryTradeContract(first: 3) {
+            id
+            contractNo
+            status
+        }
+    }
+""")
 
 # --- 1. Blockchain connection -----------------------------------------
 
 print("Checking blockchain status...")
 try:
-    status = client.blockchain.status()
+    status = status_future.result()
     if status.connected:
         print(f"  Connected  chain={status.chain_id}  contract={status.contract_address}")
     else:
@@ -63,7 +51,7 @@ except HavonaError as e:
 
 print("\nFetching trades (first 10)...")
 try:
-    trades = client.trades.list(limit=10)
+    trades = trades_future.result()
     if trades:
         for t in trades:
             print(f"  {t.contract_no:20s}  {t.status:10s}  blockchain={t.blockchain_status or 'n/a'}")
@@ -72,20 +60,20 @@ try:
 except HavonaError as e:
     print(f"  Error: {e}")
 
+# To walk *all* trades without loading them at once, iterate with
+# server-side paging — the next page is prefetched while you process:
+#
+# for t in client.trades.iter(page_size=50):
+#     process(t)
+
 # --- 3. Raw GraphQL passthrough --------------------------------------
 
 print("\nRaw GraphQL query...")
 try:
-    data = client.graphql("""
-        query {
-            queryTradeContract(first: 3) {
-                id
-                contractNo
-                status
-            }
-        }
-    """)
+    data = graphql_future.result()
     for t in data.get("queryTradeContract", []):
         print(f"  id={t['id'][:8]}  contractNo={t.get('contractNo')}")
 except HavonaError as e:
     print(f"  Error: {e}")
+
+executor.shutdown()
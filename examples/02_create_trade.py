@@ -9,21 +9,9 @@ Prerequisites:
     cp .env.example .env   # fill in your credentials
 """
 
-import os
-from dotenv import load_dotenv
-
-load_dotenv()
-
 from havona_sdk import HavonaClient, HavonaError, ValidationError
 
-client = HavonaClient.from_credentials(
-    base_url=os.environ["HAVONA_API_URL"],
-    auth0_domain=os.environ["AUTH0_DOMAIN"],
-    auth0_audience=os.environ["AUTH0_AUDIENCE"],
-    auth0_client_id=os.environ["AUTH0_CLIENT_ID"],
-    username=os.environ["HAVONA_EMAIL"],
-    password=os.environ["HAVONA_PASSWORD"],
-)
+client = HavonaClient.from_env(load_env=True)
 
 # --- 1. Create a draft trade -----------------------------------------
 
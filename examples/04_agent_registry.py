@@ -12,21 +12,9 @@ Prerequisites:
     cp .env.example .env   # fill in your credentials
 """
 
-import os
-from dotenv import load_dotenv
+from havona_sdk import HavonaClient, HavonaError
 
-load_dotenv()
-
-from havona_sdk import HavonaClient, HavonaError, NotFoundError
-
-client = HavonaClient.from_credentials(
-    base_url=os.environ["HAVONA_API_URL"],
-    auth0_domain=os.environ["AUTH0_DOMAIN"],
-    auth0_audience=os.environ["AUTH0_AUDIENCE"],
-    auth0_client_id=os.environ["AUTH0_CLIENT_ID"],
-    username=os.environ["HAVONA_EMAIL"],
-    password=os.environ["HAVONA_PASSWORD"],
-)
+client = HavonaClient.from_env(load_env=True)
 
 # --- Service health --------------------------------------------------
 
@@ -57,10 +45,39 @@ except HavonaError as e:
 
 if agents:
     print("\nReputation scores:")
-    for agent in agents:
-        try:
-            rep = client.agents.get_reputation(agent.id)
+    try:
+        # One batched GraphQL request instead of one REST call per agent
+        reps = client.agents.get_reputations([a.id for a in agents])
+        for agent in agents:
+            rep = reps[agent.id]
             avg = f"{rep.average_score:.2f}" if rep.average_score is not None else "n/a"
             print(f"  [{agent.id}] total_feedback={rep.total_feedback}  avg_score={avg}")
-        except (HavonaError, NotFoundError) as e:
-            print(f"  [{agent.id}] reputation unavailable: {e}")
+    except HavonaError as e:
+        print(f"  reputation unavailable: {e}")
+
+# --- Concurrent variant (requires: pip install havona-sdk[async]) ----
+#
+# The loop above pays one round-trip per agent. With AsyncHavonaClient
+# the N requests overlap, collapsing N·RTT to roughly one:
+#
+# import asyncio
+# import os
+# from havona_sdk.async_client import AsyncHavonaClient
+#
+# async def main():
+#     async with AsyncHavonaClient.from_credentials(
+#         base_url=os.environ["HAVONA_API_URL"],
+#         auth0_domain=os.environ["AUTH0_DOMAIN"],
+#         auth0_audience=os.environ["AUTH0_AUDIENCE"],
+#         auth0_client_id=os.environ["AUTH0_CLIENT_ID"],
+#         username=os.environ["HAVONA_EMAIL"],
+#         password=os.environ["HAVONA_PASSWORD"],
+#     ) as client:
+#         agents = await client.agents.list()
+#         reps = await asyncio.gather(
+#             *(client.agents.get_reputation(a.id) for a in agents)
+#         )
+#         for agent, rep in zip(agents, reps):
+#             print(f"  [{agent.id}] total_feedback={rep.total_feedback}")
+#
+# asyncio.run(main())
@@ -19,7 +19,8 @@ Quick start::
     status = client.blockchain.status()
 """
 
-from .client import HavonaClient
+import importlib
+
 from .exceptions import (
     AuthError,
     BlockchainError,
@@ -28,17 +29,36 @@ from .exceptions import (
     NotFoundError,
     ValidationError,
 )
-from .models import (
-    Agent,
-    AgentReputation,
-    BlockchainPersistence,
-    BlockchainStatus,
-    ETRType,
-    ExtractionResult,
-    Trade,
-)
 
-__version__ = "0.1.0"
+from ._version import __version__
+
+# Heavy modules (client pulls in requests; models is pure but sizeable) are
+# loaded on first attribute access (PEP 562) so short-lived CLI scripts only
+# pay for what they touch.
+_LAZY_ATTRS = {
+    "HavonaClient": ".client",
+    "Agent": ".models",
+    "AgentReputation": ".models",
+    "BlockchainPersistence": ".models",
+    "BlockchainStatus": ".models",
+    "ETRType": ".models",
+    "ExtractionResult": ".models",
+    "Trade": ".models",
+}
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
 __all__ = [
     "HavonaClient",
@@ -0,0 +1,45 @@
+"""Tiny per-instance TTL cache for metadata endpoints that rarely change."""
+
+import functools
+import time
+from typing import Optional
+
+
+def ttl_cache(seconds: Optional[int] = None):
+    """
+    Cache a resource method's return value on the instance.
+
+    Entries live in ``self._ttl_cache`` keyed by method name + args. With
+    ``seconds=None`` (the default) the TTL is the client's ``metadata_ttl``,
+    so ``HavonaClient(metadata_ttl=...)`` tunes it and ``metadata_ttl=0``
+    disables the cache. An explicit ``seconds`` pins the TTL regardless of
+    the client setting, for endpoints whose freshness needs differ from the
+    metadata catalogue's. A raising call evicts any stale entry so a cache
+    never masks an outage.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            ttl = seconds if seconds is not None else self._client._metadata_ttl
+            if not ttl:
+                return func(self, *args, **kwargs)
+
+            cache = self.__dict__.setdefault("_ttl_cache", {})
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            hit = cache.get(key)
+            now = time.monotonic()
+            if hit is not None and now < hit[1]:
+                return hit[0]
+
+            try:
+                value = func(self, *args, **kwargs)
+            except Exception:
+                cache.pop(key, None)
+                raise
+            cache[key] = (value, now + ttl)
+            return value
+
+        return wrapper
+
+    return decorator
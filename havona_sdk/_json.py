@@ -0,0 +1,28 @@
+"""JSON encode/decode helpers for the hot request/response path.
+
+Prefers orjson (Rust, SIMD-accelerated), falls back to ujson, then stdlib
+json. ``loads`` accepts bytes directly, so callers can pass
+``resp.content`` and skip the string-decoding detour ``resp.json()`` takes.
+"""
+
+try:
+    import orjson as _orjson
+
+    def loads(data):
+        return _orjson.loads(data)
+
+    def dumps(obj) -> str:
+        return _orjson.dumps(obj).decode()
+
+except ImportError:
+    try:
+        import ujson as _ujson
+
+        loads = _ujson.loads
+        dumps = _ujson.dumps
+
+    except ImportError:
+        import json as _json
+
+        loads = _json.loads
+        dumps = _json.dumps
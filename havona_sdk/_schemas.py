@@ -0,0 +1,59 @@
+"""Client-side validation for well-known write payloads.
+
+Catches obvious mistakes (bad status, malformed currency, missing
+contract number) before the HTTP call, so they fail instantly instead of
+after a full round-trip. Only fields the SDK knows about are checked —
+anything else passes through untouched for the server to judge.
+"""
+
+import re
+from typing import Any, Callable, Dict, List
+
+from .exceptions import ValidationError
+
+TRADE_STATUSES = frozenset({
+    "DRAFT",
+    "PENDING",
+    "ACTIVE",
+    "COMPLETED",
+    "CLOSED",
+    "CANCELLED",
+})
+
+_CURRENCY_RE = re.compile(r"^[A-Z]{3}$")
+
+
+def _validate_trade(payload: Dict[str, Any]) -> None:
+    errors: List[str] = []
+
+    # contractNo is required on create; updates carry an id instead
+    if "id" not in payload:
+        contract_no = payload.get("contractNo")
+        if not isinstance(contract_no, str) or not contract_no.strip():
+            errors.append("contractNo must be a non-empty string")
+
+    status = payload.get("status")
+    if status is not None and status not in TRADE_STATUSES:
+        errors.append(
+            f"status {status!r} is not one of {sorted(TRADE_STATUSES)}"
+        )
+
+    currency = payload.get("currency")
+    if currency is not None and not _CURRENCY_RE.match(str(currency)):
+        errors.append(f"currency {currency!r} must be a 3-letter ISO-4217 code")
+
+    if errors:
+        raise ValidationError("; ".join(errors))
+
+
+# Registry keyed by /dynamic type name; lookup per write is a dict hit
+_VALIDATORS: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    "TradeContract": _validate_trade,
+}
+
+
+def validate(type_name: str, payload: Dict[str, Any]) -> None:
+    """Run the client-side validator for ``type_name``, if one exists."""
+    validator = _VALIDATORS.get(type_name)
+    if validator is not None:
+        validator(payload)
@@ -0,0 +1,90 @@
+"""HTTP/2 transport for HavonaClient, backed by httpx.
+
+`HttpxSession` exposes the small slice of the requests.Session surface the
+client actually uses (headers, auth, request, mount, close), so
+``HavonaClient(..., http2=True)`` can swap it in without touching the
+request path. Under HTTP/2, concurrent calls multiplex as streams over one
+TLS connection instead of queueing head-of-line on HTTP/1.1 sockets.
+
+Requires the optional ``httpx[http2]`` dependency
+(``pip install havona-sdk[http2]``).
+"""
+
+from types import SimpleNamespace
+
+try:
+    import httpx
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "HTTP/2 support requires httpx. Install it with "
+        "'pip install httpx[http2]' or 'pip install havona-sdk[http2]'."
+    ) from exc
+
+
+def _iter_body(body, chunk_size=64 * 1024):
+    """Adapt a file-like body (e.g. a MultipartEncoder) to the byte
+    iterator httpx expects for streamed request content."""
+    while True:
+        chunk = body.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class HttpxSession:
+    """requests.Session look-alike over httpx.Client(http2=True)."""
+
+    def __init__(self):
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+        self.headers = {}
+        self.auth = None
+
+    def request(
+        self,
+        method,
+        url,
+        headers=None,
+        json=None,
+        params=None,
+        files=None,
+        data=None,
+        timeout=None,
+    ):
+        merged = dict(self.headers)
+        if headers:
+            for key, value in headers.items():
+                if value is None:
+                    # requests semantics: None drops the session header
+                    merged.pop(key, None)
+                else:
+                    merged[key] = value
+
+        if self.auth is not None:
+            # The auth hook only writes headers; hand it a minimal request
+            self.auth(SimpleNamespace(headers=merged))
+
+        kwargs = {"headers": merged, "params": params, "timeout": timeout}
+        if json is not None:
+            kwargs["json"] = json
+        if files is not None:
+            kwargs["files"] = files
+        if isinstance(data, (str, bytes)):
+            kwargs["content"] = data
+        elif hasattr(data, "read"):
+            # Streaming bodies (_request_streaming's MultipartEncoder) —
+            # httpx takes an iterator of bytes, not a file-like object
+            kwargs["content"] = _iter_body(data)
+        elif data is not None:
+            kwargs["data"] = data
+
+        return self._client.request(method, url, **kwargs)
+
+    def mount(self, prefix, adapter):
+        """No-op: adapters/retries are a urllib3 concept; httpx pools and
+        retries connections through its own transport."""
+
+    def close(self):
+        self._client.close()
@@ -0,0 +1,415 @@
+"""
+AsyncHavonaClient — asyncio variant of the Havona SDK built on aiohttp.
+
+Mirrors the sync surface for trades and agents so fan-out workloads can
+overlap their round-trips instead of paying N·RTT serially::
+
+    async with AsyncHavonaClient.from_credentials(...) as client:
+        agents = await client.agents.list()
+        reps = await asyncio.gather(
+            *(client.agents.get_reputation(a.id) for a in agents)
+        )
+
+Requires the optional ``aiohttp`` dependency (``pip install havona-sdk[async]``).
+"""
+
+import asyncio
+import os
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    import aiohttp
+except ImportError as exc:  # pragma: no cover
+    raise ImportError(
+        "AsyncHavonaClient requires aiohttp. Install it with "
+        "'pip install aiohttp' or 'pip install havona-sdk[async]'."
+    ) from exc
+
+from .auth import _TokenCache
+from .exceptions import (
+    AuthError,
+    GraphQLError,
+    HavonaError,
+    NotFoundError,
+    ValidationError,
+    error_from_status,
+)
+from .models import Agent, AgentReputation, ExtractionResult, Trade
+
+DEFAULT_TIMEOUT = 30
+
+
+class AsyncAuth0:
+    """Auth0 token management over aiohttp. Same caching behaviour as
+    :class:`havona_sdk.auth.Auth0`, guarded by an asyncio.Lock so concurrent
+    ``get_token()`` awaiters don't stampede Auth0 on a cold cache."""
+
+    def __init__(
+        self,
+        domain: str,
+        audience: str,
+        client_id: str,
+        *,
+        client_secret: Optional[str] = None,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+    ):
+        self._domain = domain.rstrip("/")
+        self._audience = audience
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._username = username
+        self._password = password
+        self._cache: Optional[_TokenCache] = None
+        self._lock = asyncio.Lock()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @classmethod
+    def from_password(cls, domain, audience, client_id, username, password) -> "AsyncAuth0":
+        return cls(
+            domain=domain,
+            audience=audience,
+            client_id=client_id,
+            username=username,
+            password=password,
+        )
+
+    @classmethod
+    def from_client_credentials(cls, domain, audience, client_id, client_secret) -> "AsyncAuth0":
+        return cls(
+            domain=domain,
+            audience=audience,
+            client_id=client_id,
+            client_secret=client_secret,
+        )
+
+    async def get_token(self, force_refresh: bool = False) -> str:
+        if not force_refresh and self._cache and self._cache.is_valid():
+            return self._cache.access_token
+
+        async with self._lock:
+            # Another awaiter may have refreshed while we waited on the lock
+            if not force_refresh and self._cache and self._cache.is_valid():
+                return self._cache.access_token
+
+            data = await self._fetch_token()
+            self._cache = _TokenCache(
+                access_token=data["access_token"],
+                expires_in=data.get("expires_in", 86400),
+            )
+            return self._cache.access_token
+
+    async def _fetch_token(self) -> dict:
+        url = f"https://{self._domain}/oauth/token"
+
+        if self._username and self._password:
+            payload = {
+                "grant_type": "password",
+                "client_id": self._client_id,
+                "audience": self._audience,
+                "username": self._username,
+                "password": self._password,
+                "scope": "openid profile email",
+            }
+        elif self._client_secret:
+            payload = {
+                "grant_type": "client_credentials",
+                "client_id": self._client_id,
+                "client_secret": self._client_secret,
+                "audience": self._audience,
+            }
+        else:
+            raise AuthError(
+                "No credentials configured. "
+                "Use AsyncAuth0.from_password() or AsyncAuth0.from_client_credentials()."
+            )
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+
+        try:
+            async with self._session.post(url, json=payload) as resp:
+                body = await resp.text()
+                if resp.status >= 400:
+                    raise AuthError(
+                        "Auth0 token request failed",
+                        status_code=resp.status,
+                        response_body=body[:300],
+                    )
+                token_data = await resp.json()
+        except aiohttp.ClientError as exc:
+            raise AuthError(f"Auth0 request failed: {exc}") from exc
+
+        if "access_token" not in token_data:
+            raise AuthError(f"Auth0 response missing access_token: {token_data}")
+
+        return token_data
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+
+class AsyncStaticToken:
+    """Pre-obtained bearer token with no refresh logic."""
+
+    def __init__(self, token: str):
+        self._token = token
+
+    async def get_token(self, force_refresh: bool = False) -> str:
+        return self._token
+
+    async def close(self) -> None:
+        pass
+
+
+class AsyncTradesResource:
+    def __init__(self, client: "AsyncHavonaClient"):
+        self._client = client
+
+    async def list(self, limit: int = 100, fields: Optional[str] = None) -> List[Trade]:
+        from .resources.trades import _TRADE_FIELDS, _list_query
+
+        data = await self._client.graphql(
+            _list_query(fields or _TRADE_FIELDS), variables={"first": limit}
+        )
+        return [Trade.from_dict(r) for r in data.get("queryTradeContract") or []]
+
+    async def get(self, trade_id: str, fields: Optional[str] = None) -> Trade:
+        from .resources.trades import _TRADE_FIELDS, _get_query
+
+        data = await self._client.graphql(
+            _get_query(fields or _TRADE_FIELDS), variables={"id": trade_id}
+        )
+        raw = data.get("getTradeContract")
+        if raw is None:
+            raise NotFoundError(f"TradeContract '{trade_id}' not found")
+        return Trade.from_dict(raw)
+
+    async def create(self, **kwargs: Any) -> Trade:
+        from .resources.trades import _normalise_fields
+
+        result = await self._client.write("TradeContract", _normalise_fields(kwargs))
+        return Trade.from_dict(result)
+
+    async def update(self, trade_id: str, **kwargs: Any) -> Dict[str, Any]:
+        from .resources.trades import _normalise_fields
+
+        payload = _normalise_fields(kwargs)
+        payload["id"] = trade_id
+        return await self._client.write("TradeContract", payload)
+
+
+class AsyncDocumentsResource:
+    def __init__(self, client: "AsyncHavonaClient"):
+        self._client = client
+
+    async def extract(
+        self,
+        file_path: str,
+        document_type: str,
+        mode: str = "native",
+    ) -> ExtractionResult:
+        """Extract fields from an ETR PDF. Nothing is saved."""
+        name = os.path.basename(file_path)
+        with open(file_path, "rb") as fh:
+            form = aiohttp.FormData()
+            form.add_field("file", fh, filename=name, content_type="application/pdf")
+            form.add_field("document_type", document_type)
+            form.add_field("mode", mode)
+            resp = await self._client._request("POST", "/api/etr/extract", data=form)
+            raw = await resp.json()
+        return ExtractionResult.from_dict(raw)
+
+    async def extract_trade(self, file_path: str) -> ExtractionResult:
+        """Extract TradeContract fields from an unstructured document. Nothing is saved."""
+        from .resources.documents import _guess_content_type
+
+        name = os.path.basename(file_path)
+        with open(file_path, "rb") as fh:
+            form = aiohttp.FormData()
+            form.add_field(
+                "file", fh, filename=name, content_type=_guess_content_type(name)
+            )
+            resp = await self._client._request("POST", "/api/blotting/extract-pdf", data=form)
+            raw = await resp.json()
+        return ExtractionResult.from_dict(raw)
+
+    async def extract_trade_many(
+        self,
+        file_paths: List[str],
+        max_concurrency: int = 8,
+    ) -> List[ExtractionResult]:
+        """Extract many documents concurrently over the shared connection pool.
+
+        A semaphore bounds how many uploads are in flight at once, so the
+        event loop pipelines up to ``max_concurrency`` extractions without
+        threads. Results come back in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def one(path: str) -> ExtractionResult:
+            async with semaphore:
+                return await self.extract_trade(path)
+
+        return list(await asyncio.gather(*(one(p) for p in file_paths)))
+
+
+class AsyncAgentsResource:
+    def __init__(self, client: "AsyncHavonaClient"):
+        self._client = client
+
+    async def list(self) -> List[Agent]:
+        """Returns an empty list if the blockchain connection is unavailable."""
+        resp = await self._client._request("GET", "/api/agents")
+        data = await resp.json()
+        raw_agents = data.get("agents") or []
+        return [Agent.from_dict(a) for a in raw_agents]
+
+    async def get(self, agent_id: int) -> Agent:
+        resp = await self._client._request("GET", f"/api/agents/{agent_id}")
+        return Agent.from_dict(await resp.json())
+
+    async def get_reputation(self, agent_id: int) -> AgentReputation:
+        resp = await self._client._request("GET", f"/api/agents/{agent_id}/reputation")
+        return AgentReputation.from_dict(agent_id, await resp.json())
+
+    async def status(self) -> Dict[str, Any]:
+        resp = await self._client._request("GET", "/api/agents/status")
+        return await resp.json()
+
+
+class AsyncHavonaClient:
+    def __init__(self, base_url: str, token_provider, timeout: int = DEFAULT_TIMEOUT):
+        self._base_url = base_url.rstrip("/")
+        self._token_provider = token_provider
+        self._timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self.trades = AsyncTradesResource(self)
+        self.agents = AsyncAgentsResource(self)
+        self.documents = AsyncDocumentsResource(self)
+
+    @classmethod
+    def from_credentials(
+        cls,
+        base_url: str,
+        auth0_domain: str,
+        auth0_audience: str,
+        auth0_client_id: str,
+        username: str,
+        password: str,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> "AsyncHavonaClient":
+        """Auth0 password grant. Tokens are cached and refreshed automatically."""
+        auth = AsyncAuth0.from_password(
+            domain=auth0_domain,
+            audience=auth0_audience,
+            client_id=auth0_client_id,
+            username=username,
+            password=password,
+        )
+        return cls(base_url=base_url, token_provider=auth, timeout=timeout)
+
+    @classmethod
+    def from_token(
+        cls,
+        base_url: str,
+        token: str,
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> "AsyncHavonaClient":
+        """Inject a pre-obtained bearer token. No refresh logic."""
+        return cls(
+            base_url=base_url,
+            token_provider=AsyncStaticToken(token),
+            timeout=timeout,
+        )
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            # No default Content-Type: aiohttp sets application/json for
+            # json= bodies and the multipart boundary for FormData uploads;
+            # a session-wide header would clobber the latter.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=20, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=self._timeout),
+            )
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        json: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        data=None,
+    ) -> aiohttp.ClientResponse:
+        url = f"{self._base_url}{path}"
+        token = await self._token_provider.get_token()
+        headers = {"Authorization": f"Bearer {token}"}
+
+        session = self._ensure_session()
+        resp = await session.request(
+            method,
+            url,
+            headers=headers,
+            json=json,
+            params=params,
+            data=data,
+        )
+        return await self._raise_for_status(resp)
+
+    async def _raise_for_status(self, resp: aiohttp.ClientResponse) -> aiohttp.ClientResponse:
+        if resp.status < 400:
+            return resp
+        body = (await resp.read())[:500].decode("utf-8", "replace")
+        raise error_from_status(resp.status, body)
+
+    async def graphql(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run a GraphQL query against /graphql. Returns the ``data`` dict.
+
+            data = await client.graphql('''
+                query { queryTradeContract(first: 10) { id contractNo status } }
+            ''')
+        """
+        payload: Dict[str, Any] = {"query": query}
+        if variables:
+            payload["variables"] = variables
+
+        resp = await self._request("POST", "/graphql", json=payload)
+        result = await resp.json()
+
+        if result.get("errors"):
+            raise GraphQLError(result["errors"])
+
+        return result.get("data", {})
+
+    async def write(self, type_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Write via POST /dynamic. Omit ``id`` to create; include it to update.
+
+            result = await client.write("TradeContract", {"contractNo": "TC-001"})
+        """
+        data = {"type": type_name, **payload}
+        resp = await self._request("POST", "/dynamic", json=data)
+        return await resp.json()
+
+    async def close(self) -> None:
+        """Release pooled connections. Safe to call more than once."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        await self._token_provider.close()
+
+    async def __aenter__(self) -> "AsyncHavonaClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
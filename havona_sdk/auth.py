@@ -1,10 +1,16 @@
 """Auth0 token management — password grant, client credentials, and static token."""
 
+import base64
+import json
+import os
+import threading
 import time
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Union
 
 import requests
 
+from . import _json
 from .exceptions import AuthError
 
 
@@ -13,11 +19,13 @@ class _TokenCache:
 
     def __init__(self, access_token: str, expires_in: int = 86400):
         self.access_token = access_token
-        # Subtract 60 s so we refresh slightly before actual expiry
-        self._expires_at = time.monotonic() + expires_in - 60  # refresh slightly early
+        # Subtract 60 s so we refresh slightly before actual expiry.
+        # Stored as monotonic nanoseconds: the validity check runs on every
+        # API call, and an int compare stays on the CPython fast path.
+        self._expires_at = time.monotonic_ns() + (expires_in - 60) * 1_000_000_000
 
     def is_valid(self) -> bool:
-        return time.monotonic() < self._expires_at
+        return time.monotonic_ns() < self._expires_at
 
 
 class Auth0:
@@ -31,6 +39,7 @@ class Auth0:
         client_secret: Optional[str] = None,
         username: Optional[str] = None,
         password: Optional[str] = None,
+        cache_path: Optional[Union[str, Path]] = None,
     ):
         self._domain = domain.rstrip("/")
         self._audience = audience
@@ -39,36 +48,99 @@ class Auth0:
         self._username = username
         self._password = password
         self._cache: Optional[_TokenCache] = None
+        # Single-flight: only one refresh hits /oauth/token on a cold cache
+        self._lock = threading.Lock()
+        # Optional on-disk cache so short-lived CLI runs skip Auth0 entirely
+        self._cache_path = Path(cache_path) if cache_path else None
+        # Reuse one TLS connection across token refreshes
+        self._session = requests.Session()
 
     @classmethod
-    def from_password(cls, domain, audience, client_id, username, password) -> "Auth0":
+    def from_password(cls, domain, audience, client_id, username, password,
+                      cache_path=None) -> "Auth0":
         return cls(
             domain=domain,
             audience=audience,
             client_id=client_id,
             username=username,
             password=password,
+            cache_path=cache_path,
         )
 
     @classmethod
-    def from_client_credentials(cls, domain, audience, client_id, client_secret) -> "Auth0":
+    def from_client_credentials(cls, domain, audience, client_id, client_secret,
+                                cache_path=None) -> "Auth0":
         return cls(
             domain=domain,
             audience=audience,
             client_id=client_id,
             client_secret=client_secret,
+            cache_path=cache_path,
         )
 
     def get_token(self, force_refresh: bool = False) -> str:
-        if not force_refresh and self._cache and self._cache.is_valid():
+        # Fast path without the lock; the common case is a warm cache.
+        # Inlined expiry compare — this runs on every API call.
+        cache = self._cache
+        if (
+            not force_refresh
+            and cache is not None
+            and time.monotonic_ns() < cache._expires_at
+        ):
+            return cache.access_token
+
+        with self._lock:
+            # Double-check: another thread may have refreshed while we waited
+            if not force_refresh and self._cache and self._cache.is_valid():
+                return self._cache.access_token
+
+            if not force_refresh and self._load_disk_cache():
+                return self._cache.access_token
+
+            data = self._fetch_token()
+            # Trust the JWT's own exp claim over the response's expires_in
+            # when it decodes — it's what the server will actually enforce
+            expires_in = _jwt_expires_in(
+                data["access_token"], data.get("expires_in", 86400)
+            )
+            self._cache = _TokenCache(
+                access_token=data["access_token"],
+                expires_in=expires_in,
+            )
+            self._store_disk_cache(data["access_token"], expires_in)
             return self._cache.access_token
 
-        data = self._fetch_token()
+    def _load_disk_cache(self) -> bool:
+        """Populate self._cache from disk if a still-valid token is stored."""
+        if self._cache_path is None:
+            return False
+        try:
+            stored = json.loads(self._cache_path.read_text())
+            remaining = stored["expires_at"] - time.time()
+        except (OSError, ValueError, KeyError):
+            return False
+        if remaining <= 60:
+            return False
         self._cache = _TokenCache(
-            access_token=data["access_token"],
-            expires_in=data.get("expires_in", 86400),
+            access_token=stored["access_token"],
+            expires_in=int(remaining),
         )
-        return self._cache.access_token
+        return True
+
+    def _store_disk_cache(self, access_token: str, expires_in: int) -> None:
+        if self._cache_path is None:
+            return
+        try:
+            # 0600: the file holds a bearer token
+            fd = os.open(self._cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as fh:
+                json.dump(
+                    {"access_token": access_token,
+                     "expires_at": time.time() + expires_in},
+                    fh,
+                )
+        except OSError:
+            pass  # disk cache is best-effort; the in-memory cache still works
 
     def _fetch_token(self) -> dict:
         url = f"https://{self._domain}/oauth/token"
@@ -96,7 +168,7 @@ class Auth0:
             )
 
         try:
-            resp = requests.post(url, json=payload, timeout=10)
+            resp = self._session.post(url, json=payload, timeout=10)
         except requests.exceptions.RequestException as exc:
             raise AuthError(f"Auth0 request failed: {exc}") from exc
 
@@ -107,16 +179,31 @@ class Auth0:
                 response_body=resp.text[:300],
             )
 
-        token_data = resp.json()
+        token_data = _json.loads(resp.content)
         if "access_token" not in token_data:
             raise AuthError(f"Auth0 response missing access_token: {token_data}")
 
         return token_data
 
 
+def _jwt_expires_in(token: str, default: int) -> int:
+    """Seconds until the JWT's exp claim, or ``default`` if the token isn't
+    a decodable JWT (opaque tokens, test fixtures)."""
+    try:
+        payload_b64 = token.split(".")[1]
+        payload_b64 += "=" * (-len(payload_b64) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(payload_b64))
+        remaining = int(payload["exp"] - time.time())
+        return remaining if remaining > 0 else default
+    except (IndexError, KeyError, ValueError, TypeError):
+        return default
+
+
 class StaticToken:
     """Pre-obtained bearer token with no refresh logic."""
 
+    __slots__ = ("_token",)
+
     def __init__(self, token: str):
         self._token = token
 
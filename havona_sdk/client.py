@@ -14,10 +14,19 @@ HavonaClient — main entry point for the Havona SDK.
     status = client.blockchain.status()
 """
 
-from typing import Any, Dict, Optional
+import functools
+import hashlib
+import os
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from . import _json, _schemas
+from ._version import __version__
 from .auth import Auth0, StaticToken
 from .exceptions import (
     AuthError,
@@ -25,27 +34,310 @@ from .exceptions import (
     HavonaError,
     NotFoundError,
     ValidationError,
+    error_from_status,
 )
-from .resources.agents import AgentsResource
-from .resources.blockchain import BlockchainResource
-from .resources.documents import DocumentsResource
-from .resources.etrs import ETRsResource
-from .resources.trades import TradesResource
+
+# Only advertise brotli when a decoder is importable (the optional perf
+# extra); otherwise a server honoring "br" would hand back bytes urllib3
+# passes through undecoded and every JSON parse would fail.
+try:
+    import brotli  # noqa: F401
+    _ACCEPT_ENCODING = "gzip, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        _ACCEPT_ENCODING = "gzip, br"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip"
+
+if TYPE_CHECKING:
+    from .resources.agents import AgentsResource
+    from .resources.blockchain import BlockchainResource
+    from .resources.documents import DocumentsResource
+    from .resources.etrs import ETRsResource
+    from .resources.trades import TradesResource
 
 DEFAULT_TIMEOUT = 30
 
 
+class _BearerAuth(requests.auth.AuthBase):
+    """Injects the current bearer token at request-prepare time, so the
+    token provider's cache/refresh logic runs on every call without the
+    client allocating a headers dict per request."""
+
+    def __init__(self, token_provider):
+        self._token_provider = token_provider
+        # Rendered header for the last token seen, so the f-string only
+        # reruns when the provider actually rotates the token
+        self._last_token: Optional[str] = None
+        self._last_value: str = ""
+
+    def __call__(self, req):
+        token = self._token_provider.get_token()
+        if token is not self._last_token:
+            self._last_token = token
+            self._last_value = f"Bearer {token}"
+        req.headers["Authorization"] = self._last_value
+        return req
+
+
+def _is_read_operation(query: str) -> bool:
+    """True for GraphQL queries (anonymous ``{...}`` or ``query ...``).
+
+    Mutations and subscriptions must never share an in-flight request:
+    collapsing two identical mutations would drop one caller's write while
+    still handing it a success result.
+    """
+    stripped = query.lstrip()
+    return stripped.startswith("{") or stripped.startswith("query")
+
+
+def _inflight_key(query: str, variables: Optional[Dict[str, Any]]) -> Optional[tuple]:
+    """Dedup key for an in-flight GraphQL call, or None when the variables
+    aren't hashable (e.g. nested mutation inputs) and dedup must be skipped."""
+    try:
+        key = (
+            hashlib.blake2b(query.encode(), digest_size=8).digest(),
+            tuple(sorted((variables or {}).items())),
+        )
+        hash(key)  # unhashable variable values surface here, not in the dict
+        return key
+    except TypeError:
+        return None
+
+
+def _persisted_query_not_found(result: Dict[str, Any]) -> bool:
+    """True if the GraphQL errors say the server doesn't know this hash."""
+    for error in result.get("errors") or []:
+        code = (error.get("extensions") or {}).get("code")
+        if code == "PERSISTED_QUERY_NOT_FOUND":
+            return True
+        if error.get("message") == "PersistedQueryNotFound":
+            return True
+    return False
+
+
+@functools.lru_cache(maxsize=256)
+def _full_url(base_url: str, path: str) -> str:
+    """Join base URL and endpoint path once per endpoint, not per call.
+
+    Module-level (keyed on both parts) rather than a method so lru_cache
+    doesn't pin client instances alive.
+    """
+    return f"{base_url}{path}"
+
+
+class _GraphQLBatcher:
+    """Coalesces concurrent graphql() calls into one array-body POST.
+
+    Callers enqueue a ``{query, variables}`` payload and get a Future back.
+    The batch flushes when it reaches ``max_batch`` or ``interval_ms`` after
+    the first pending entry, whichever comes first, and each caller's Future
+    resolves to its own entry in the response array.
+    """
+
+    def __init__(self, client: "HavonaClient", interval_ms: int = 10, max_batch: int = 20):
+        self._client = client
+        self._interval = interval_ms / 1000.0
+        self._max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending: List[tuple] = []  # (payload, Future)
+        self._timer: Optional[threading.Timer] = None
+
+    def submit(self, payload: Dict[str, Any]) -> "Future[Dict[str, Any]]":
+        future: "Future[Dict[str, Any]]" = Future()
+        flush_now = None
+        with self._lock:
+            self._pending.append((payload, future))
+            if len(self._pending) >= self._max_batch:
+                flush_now = self._take_pending()
+            elif self._timer is None:
+                self._timer = threading.Timer(self._interval, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self._flush(flush_now)
+        return future
+
+    def _take_pending(self) -> List[tuple]:
+        # Caller must hold self._lock
+        batch, self._pending = self._pending, []
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            batch = self._take_pending()
+        if batch:
+            self._flush(batch)
+
+    def _flush(self, batch: List[tuple]) -> None:
+        payloads = [payload for payload, _ in batch]
+        # One mutation taints the whole batch: the array body stands or
+        # falls as a unit, so it must not be status-retried either.
+        session = self._client._session
+        for payload in payloads:
+            if not _is_read_operation(payload.get("query", "")):
+                session = self._client._write_session
+                break
+        try:
+            resp = self._client._request(
+                "POST", "/graphql", json=payloads, session=session
+            )
+            results = _json.loads(resp.content)
+            if not isinstance(results, list) or len(results) != len(batch):
+                raise HavonaError(
+                    "Batched GraphQL response was not an array of matching length; "
+                    "the server may not support array-body batching"
+                )
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if result.get("errors"):
+                future.set_exception(GraphQLError(result["errors"]))
+            else:
+                future.set_result(result.get("data", {}))
+
+
 class HavonaClient:
-    def __init__(self, base_url: str, token_provider, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(
+        self,
+        base_url: str,
+        token_provider,
+        timeout: int = DEFAULT_TIMEOUT,
+        batch_graphql: bool = False,
+        metadata_ttl: int = 300,
+        retries: int = 3,
+        backoff: float = 0.3,
+        http2: bool = False,
+    ):
         self._base_url = base_url.rstrip("/")
         self._token_provider = token_provider
         self._timeout = timeout
+        # TTL (seconds) for cached metadata endpoints such as
+        # documents.supported_types() and agents.status(); 0 disables.
+        # blockchain.status() keeps its own pinned short TTL instead.
+        self._metadata_ttl = metadata_ttl
+        # Opt-in until the server confirms array-body /graphql support
+        self._batcher = _GraphQLBatcher(self) if batch_graphql else None
+        # Queries the server has seen in full, for persisted-query calls
+        self._apq_cache: Dict[str, str] = {}
+        # In-flight GraphQL calls, keyed by query hash + variables, so
+        # identical simultaneous reads collapse onto one request
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # One pooled session per client: keep-alive avoids a fresh TCP+TLS
+        # handshake on every call when scripts issue back-to-back requests.
+        # http2=True swaps in an httpx-backed session whose concurrent calls
+        # multiplex over a single connection (needs havona-sdk[http2]).
+        if http2:
+            from ._transport import HttpxSession
+            self._session = HttpxSession()
+            # httpx performs no status-based retries, so the one session is
+            # already safe for mutations
+            self._write_session = self._session
+        else:
+            self._session = requests.Session()
+            # GraphQL mutations need the write retry policy (429 only), but
+            # they share the /graphql URL with reads, so the split happens
+            # at the session rather than at an adapter mount.
+            self._write_session = requests.Session()
+
+        sessions = [self._session]
+        if self._write_session is not self._session:
+            sessions.append(self._write_session)
+        auth = (
+            None if isinstance(token_provider, StaticToken)
+            else _BearerAuth(token_provider)
+        )
+        for session in sessions:
+            if auth is None:
+                # The token never changes: bake it into the session headers
+                # and skip the per-request auth hook entirely
+                session.headers["Authorization"] = (
+                    f"Bearer {token_provider.get_token()}"
+                )
+            else:
+                session.auth = auth
+            session.headers.update({
+                "Content-Type": "application/json",
+                # Let the server compress responses; br is included only when
+                # a brotli decoder is installed (see _ACCEPT_ENCODING above)
+                "Accept-Encoding": _ACCEPT_ENCODING,
+                "User-Agent": f"havona-sdk/{__version__}",
+            })
+        # Retries happen inside urllib3, so they reuse the same pooled
+        # keep-alive connection; Retry-After is honoured on 429s. POST stays
+        # in the method list for the GraphQL read path and rate limits.
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=["GET", "POST", "PATCH", "PUT", "DELETE"],
+                respect_retry_after_header=True,
+            ),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        # Writes (/dynamic, GraphQL mutations) dispatch blockchain records
+        # and are not idempotent: a 502/504 can arrive after the upstream
+        # write landed, so resending would duplicate it. Only the explicit
+        # 429 rejection (request never ran) is safe to retry. requests picks
+        # the adapter by longest URL prefix, so this overrides the general
+        # one for /dynamic; mutations go through the write session, whose
+        # every request uses it.
+        write_adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff,
+                status_forcelist=[429],
+                allowed_methods=["POST"],
+                respect_retry_after_header=True,
+            ),
+        )
+        self._session.mount(f"{self._base_url}/dynamic", write_adapter)
+        if self._write_session is not self._session:
+            self._write_session.mount("https://", write_adapter)
+            self._write_session.mount("http://", write_adapter)
+
+    # Resources are built (and their modules imported) on first access, so
+    # a script that only reads trades never loads the extraction code.
+
+    @functools.cached_property
+    def trades(self) -> "TradesResource":
+        from .resources.trades import TradesResource
+        return TradesResource(self)
+
+    @functools.cached_property
+    def documents(self) -> "DocumentsResource":
+        from .resources.documents import DocumentsResource
+        return DocumentsResource(self)
+
+    @functools.cached_property
+    def agents(self) -> "AgentsResource":
+        from .resources.agents import AgentsResource
+        return AgentsResource(self)
 
-        self.trades = TradesResource(self)
-        self.documents = DocumentsResource(self)
-        self.agents = AgentsResource(self)
-        self.etrs = ETRsResource(self)
-        self.blockchain = BlockchainResource(self)
+    @functools.cached_property
+    def etrs(self) -> "ETRsResource":
+        from .resources.etrs import ETRsResource
+        return ETRsResource(self)
+
+    @functools.cached_property
+    def blockchain(self) -> "BlockchainResource":
+        from .resources.blockchain import BlockchainResource
+        return BlockchainResource(self)
 
     @classmethod
     def from_credentials(
@@ -57,8 +349,13 @@ class HavonaClient:
         username: str,
         password: str,
         timeout: int = DEFAULT_TIMEOUT,
+        **kwargs: Any,
     ) -> "HavonaClient":
-        """Auth0 password grant. Tokens are cached and refreshed automatically."""
+        """Auth0 password grant. Tokens are cached and refreshed automatically.
+
+        Extra keyword arguments (``http2``, ``batch_graphql``, ``retries``,
+        ``backoff``, ``metadata_ttl``) pass through to ``HavonaClient``.
+        """
         auth = Auth0.from_password(
             domain=auth0_domain,
             audience=auth0_audience,
@@ -66,7 +363,7 @@ class HavonaClient:
             username=username,
             password=password,
         )
-        return cls(base_url=base_url, token_provider=auth, timeout=timeout)
+        return cls(base_url=base_url, token_provider=auth, timeout=timeout, **kwargs)
 
     @classmethod
     def from_m2m(
@@ -77,16 +374,20 @@ class HavonaClient:
         auth0_client_id: str,
         auth0_client_secret: str,
         timeout: int = DEFAULT_TIMEOUT,
+        **kwargs: Any,
     ) -> "HavonaClient":
         """Auth0 client credentials (M2M). Note: these tokens carry no email claim
-        and can't access user-scoped endpoints like /graphql."""
+        and can't access user-scoped endpoints like /graphql.
+
+        Extra keyword arguments pass through to ``HavonaClient``.
+        """
         auth = Auth0.from_client_credentials(
             domain=auth0_domain,
             audience=auth0_audience,
             client_id=auth0_client_id,
             client_secret=auth0_client_secret,
         )
-        return cls(base_url=base_url, token_provider=auth, timeout=timeout)
+        return cls(base_url=base_url, token_provider=auth, timeout=timeout, **kwargs)
 
     @classmethod
     def from_token(
@@ -94,34 +395,114 @@ class HavonaClient:
         base_url: str,
         token: str,
         timeout: int = DEFAULT_TIMEOUT,
+        **kwargs: Any,
     ) -> "HavonaClient":
-        """Inject a pre-obtained bearer token. No refresh logic."""
-        return cls(base_url=base_url, token_provider=StaticToken(token), timeout=timeout)
+        """Inject a pre-obtained bearer token. No refresh logic.
 
-    def _headers(self) -> Dict[str, str]:
-        token = self._token_provider.get_token()
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {token}",
-        }
+        Extra keyword arguments pass through to ``HavonaClient``.
+        """
+        return cls(
+            base_url=base_url,
+            token_provider=StaticToken(token),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    @classmethod
+    def from_env(
+        cls,
+        load_env: bool = False,
+        timeout: int = DEFAULT_TIMEOUT,
+        **kwargs: Any,
+    ) -> "HavonaClient":
+        """
+        Build a client from environment variables.
+
+        Requires ``HAVONA_API_URL`` plus credentials, tried in order:
+
+        1. ``HAVONA_TOKEN`` → from_token()
+        2. ``HAVONA_EMAIL`` + ``HAVONA_PASSWORD`` (with ``AUTH0_DOMAIN``,
+           ``AUTH0_AUDIENCE``, ``AUTH0_CLIENT_ID``) → from_credentials()
+        3. ``AUTH0_M2M_CLIENT_SECRET`` (with ``AUTH0_M2M_CLIENT_ID`` or
+           ``AUTH0_CLIENT_ID``) → from_m2m()
+
+        ``load_env=True`` reads a local ``.env`` first (needs python-dotenv).
+        Deployments whose environment is already set (CI, Docker, k8s) skip
+        the dotenv parse entirely by leaving the default.
+
+        Extra keyword arguments pass through to ``HavonaClient``.
+        """
+        if load_env:
+            from dotenv import load_dotenv
+            load_dotenv()
+
+        base_url = os.environ["HAVONA_API_URL"]
+
+        token = os.environ.get("HAVONA_TOKEN")
+        if token:
+            return cls.from_token(
+                base_url=base_url, token=token, timeout=timeout, **kwargs
+            )
+
+        username = os.environ.get("HAVONA_EMAIL")
+        password = os.environ.get("HAVONA_PASSWORD")
+        if username and password:
+            return cls.from_credentials(
+                base_url=base_url,
+                auth0_domain=os.environ["AUTH0_DOMAIN"],
+                auth0_audience=os.environ["AUTH0_AUDIENCE"],
+                auth0_client_id=os.environ["AUTH0_CLIENT_ID"],
+                username=username,
+                password=password,
+                timeout=timeout,
+                **kwargs,
+            )
+
+        client_secret = os.environ.get("AUTH0_M2M_CLIENT_SECRET")
+        if client_secret:
+            return cls.from_m2m(
+                base_url=base_url,
+                auth0_domain=os.environ["AUTH0_DOMAIN"],
+                auth0_audience=os.environ["AUTH0_AUDIENCE"],
+                auth0_client_id=(
+                    os.environ.get("AUTH0_M2M_CLIENT_ID")
+                    or os.environ["AUTH0_CLIENT_ID"]
+                ),
+                auth0_client_secret=client_secret,
+                timeout=timeout,
+                **kwargs,
+            )
+
+        raise AuthError(
+            "No credentials found in environment. Set HAVONA_TOKEN, "
+            "HAVONA_EMAIL/HAVONA_PASSWORD, or AUTH0_M2M_CLIENT_SECRET."
+        )
 
     def _request(
         self,
         method: str,
         path: str,
-        json: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
         params: Optional[Dict[str, Any]] = None,
         files=None,
         data=None,
+        session=None,
     ) -> requests.Response:
-        url = f"{self._base_url}{path}"
-        headers = self._headers()
+        url = _full_url(self._base_url, path)
+        headers = None
+        if session is None:
+            session = self._session
 
         if files is not None:
-            # Let requests set Content-Type with the multipart boundary
-            headers.pop("Content-Type", None)
+            # None tells requests to drop the session's Content-Type so the
+            # multipart boundary can be set instead
+            headers = {"Content-Type": None}
+        elif json is not None and data is None:
+            # Encode outbound JSON ourselves so orjson/ujson (when installed)
+            # accelerates the encode; the session header already says JSON
+            data, json = _json.dumps(json), None
 
-        resp = requests.request(
+        resp = session.request(
             method=method,
             url=url,
             headers=headers,
@@ -131,29 +512,91 @@ class HavonaClient:
             data=data,
             timeout=self._timeout,
         )
+
+        # One re-auth retry on 401: an expired-token blip shouldn't surface
+        # to the caller. Skipped for bodies we can't replay (open files).
+        # The session auth hook picks up the refreshed token on resend.
+        if resp.status_code == 401 and files is None and not hasattr(data, "read"):
+            self._token_provider.get_token(force_refresh=True)
+            resp = session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=json,
+                params=params,
+                data=data,
+                timeout=self._timeout,
+            )
+
         return self._raise_for_status(resp)
 
-    def _raise_for_status(self, resp: requests.Response) -> requests.Response:
-        if resp.ok:
-            return resp
+    def _get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """Body-less GET fast path — skips the json/files/data handling in
+        _request for the SDK's hottest read calls."""
+        resp = self._session.request(
+            method="GET",
+            url=_full_url(self._base_url, path),
+            params=params,
+            headers=headers,
+            timeout=self._timeout,
+        )
+        if resp.status_code == 401:
+            self._token_provider.get_token(force_refresh=True)
+            resp = self._session.request(
+                method="GET",
+                url=_full_url(self._base_url, path),
+                params=params,
+                headers=headers,
+                timeout=self._timeout,
+            )
+        return self._raise_for_status(resp)
+
+    def _request_streaming(self, method: str, path: str, encoder) -> requests.Response:
+        """Send a streaming multipart body (a requests_toolbelt
+        MultipartEncoder or MultipartEncoderMonitor). The body is read from
+        the underlying file in chunks instead of being buffered whole."""
+        url = _full_url(self._base_url, path)
 
-        body = resp.text[:500]
-        code = resp.status_code
+        resp = self._session.request(
+            method=method,
+            url=url,
+            headers={"Content-Type": encoder.content_type},
+            data=encoder,
+            timeout=self._timeout,
+        )
+        return self._raise_for_status(resp)
 
-        if code in (401, 403):
-            msg = "Authentication failed" if code == 401 else "Forbidden — insufficient permissions"
-            raise AuthError(msg, code, body)
-        if code == 404:
-            raise NotFoundError("Resource not found", code, body)
-        if code in (400, 422):
-            raise ValidationError("Validation error", code, body)
+    def close(self) -> None:
+        """Release pooled connections. Safe to call more than once."""
+        self._session.close()
+        if self._write_session is not self._session:
+            self._write_session.close()
 
-        raise HavonaError("Request failed", code, body)
+    def __enter__(self) -> "HavonaClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _raise_for_status(self, resp: requests.Response) -> requests.Response:
+        # status_code-based so both requests and httpx responses work
+        if resp.status_code < 400:
+            return resp
+        # Slice the raw bytes before decoding so a huge error body doesn't
+        # get fully decoded just to be truncated
+        body = resp.content[:500].decode("utf-8", "replace")
+        raise error_from_status(resp.status_code, body)
 
     def graphql(
         self,
         query: str,
         variables: Optional[Dict[str, Any]] = None,
+        persisted: bool = False,
     ) -> Dict[str, Any]:
         """
         Run a GraphQL query against /graphql. Returns the ``data`` dict.
@@ -161,13 +604,127 @@ class HavonaClient:
             data = client.graphql('''
                 query { queryTradeContract(first: 10) { id contractNo status } }
             ''')
+
+        With ``batch_graphql=True`` on the client, concurrent calls landing
+        within a ~10 ms window are coalesced into a single array-body POST;
+        each caller still blocks until its own result arrives.
+
+        With ``persisted=True`` the query is registered with the server by
+        sha256 hash (Apollo APQ protocol), and repeat calls with the same
+        query text send just the 64-byte hash instead of the full document.
+
+        Identical read queries already in flight (same query and variables,
+        e.g. from concurrent threads reading the same record) share one
+        request and one response. Mutations always dispatch individually —
+        every caller's write goes to the server. Nothing is cached once a
+        call completes.
         """
+        if persisted:
+            return self._graphql_persisted(query, variables)
+
+        key = _inflight_key(query, variables) if _is_read_operation(query) else None
+        if key is None:
+            return self._graphql_dispatch(query, variables)
+
+        with self._inflight_lock:
+            existing = self._inflight.get(key)
+            if existing is None:
+                future: "Future[Dict[str, Any]]" = Future()
+                self._inflight[key] = future
+
+        if existing is not None:
+            return existing.result()
+
+        try:
+            result = self._graphql_dispatch(query, variables)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _graphql_dispatch(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
         payload: Dict[str, Any] = {"query": query}
         if variables:
             payload["variables"] = variables
 
-        resp = self._request("POST", "/graphql", json=payload)
-        result = resp.json()
+        if self._batcher is not None:
+            return self._batcher.submit(payload).result()
+
+        return self._graphql_post(payload)
+
+    def _graphql_session(self, query: str):
+        """Pick the session for a GraphQL document: mutations go through the
+        write session so a 502/504 after the server committed is never
+        resent (see the write_adapter comment in __init__)."""
+        if _is_read_operation(query):
+            return self._session
+        return self._write_session
+
+    def _graphql_persisted(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        session = self._graphql_session(query)
+        query_hash = self._apq_cache.get(query) or hashlib.sha256(
+            query.encode()
+        ).hexdigest()
+        extensions = {"persistedQuery": {"version": 1, "sha256Hash": query_hash}}
+
+        if query in self._apq_cache:
+            # Server has seen the full text — try hash-only first
+            payload: Dict[str, Any] = {"extensions": extensions}
+            if variables:
+                payload["variables"] = variables
+            resp = self._request("POST", "/graphql", json=payload, session=session)
+            result = _json.loads(resp.content)
+            if not _persisted_query_not_found(result):
+                if result.get("errors"):
+                    raise GraphQLError(result["errors"])
+                return result.get("data", {})
+            # Server evicted the query — fall through and resend in full
+
+        payload = {"query": query, "extensions": extensions}
+        if variables:
+            payload["variables"] = variables
+        resp = self._request("POST", "/graphql", json=payload, session=session)
+        result = _json.loads(resp.content)
+
+        if result.get("errors"):
+            raise GraphQLError(result["errors"])
+
+        self._apq_cache[query] = query_hash
+        return result.get("data", {})
+
+    def graphql_immediate(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Run a GraphQL query bypassing the batcher — the escape hatch for
+        slow queries that shouldn't hold up a batch."""
+        payload: Dict[str, Any] = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        return self._graphql_post(payload)
+
+    def _graphql_post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        resp = self._request(
+            "POST",
+            "/graphql",
+            json=payload,
+            session=self._graphql_session(payload.get("query", "")),
+        )
+        result = _json.loads(resp.content)
 
         if result.get("errors"):
             raise GraphQLError(result["errors"])
@@ -180,7 +737,66 @@ class HavonaClient:
 
             result = client.write("TradeContract", {"contractNo": "TC-001", "status": "DRAFT"})
             trade_id = result["id"]
+
+        Well-known payload mistakes (bad status, malformed currency) raise
+        ValidationError locally, before any round-trip.
         """
+        _schemas.validate(type_name, payload)
         data = {"type": type_name, **payload}
         resp = self._request("POST", "/dynamic", json=data)
-        return resp.json()
+        return _json.loads(resp.content)
+
+    def write_many(
+        self,
+        type_name: str,
+        payloads: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Write many records of one type with a single POST /dynamic.
+
+            results = client.write_many("TradeContract", payloads)
+
+        The whole batch travels as one array body, so N inserts cost one
+        round-trip (and one blockchain dispatch on the server) instead of
+        N. Every payload is validated locally before anything is sent.
+        For per-item requests over one keep-alive connection — e.g. when
+        partial failure should stop at the bad record — use
+        :meth:`writer` instead.
+        """
+        for payload in payloads:
+            _schemas.validate(type_name, payload)
+        data = [{"type": type_name, **payload} for payload in payloads]
+        resp = self._request("POST", "/dynamic", json=data)
+        result = _json.loads(resp.content)
+        return result if isinstance(result, list) else [result]
+
+    def writer(self, type_name: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Pre-bind a /dynamic writer for one type, for bulk-import loops.
+
+            write = client.writer("TradeContract")
+            for payload in payloads:
+                write(payload)
+
+        The returned callable validates, encodes and POSTs exactly like
+        :meth:`write`, but the URL, encoder and session methods are resolved
+        once up front instead of per call, and the session's keep-alive
+        connection amortizes TLS across the whole loop.
+        """
+        url = _full_url(self._base_url, "/dynamic")
+        validate = _schemas.validate
+        dumps = _json.dumps
+        loads = _json.loads
+        request = self._session.request
+        timeout = self._timeout
+
+        def _write(payload: Dict[str, Any]) -> Dict[str, Any]:
+            validate(type_name, payload)
+            body = dumps({"type": type_name, **payload})
+            resp = request(method="POST", url=url, data=body, timeout=timeout)
+            if resp.status_code == 401:
+                self._token_provider.get_token(force_refresh=True)
+                resp = request(method="POST", url=url, data=body, timeout=timeout)
+            return loads(self._raise_for_status(resp).content)
+
+        return _write
@@ -38,3 +38,22 @@ class GraphQLError(HavonaError):
         messages = [e.get("message", str(e)) for e in errors]
         super().__init__(f"GraphQL errors: {messages}")
         self.errors = errors
+
+
+# One O(1) lookup on the error path; extend here as the API grows codes.
+_STATUS_MAP = {
+    401: (AuthError, "Authentication failed"),
+    403: (AuthError, "Forbidden — insufficient permissions"),
+    404: (NotFoundError, "Resource not found"),
+    400: (ValidationError, "Validation error"),
+    422: (ValidationError, "Validation error"),
+}
+
+
+def error_from_status(status_code: int, body: str) -> HavonaError:
+    """Map an HTTP error status to the SDK exception for it.
+
+    Shared by the sync and async clients so both raise identically.
+    """
+    exc_cls, msg = _STATUS_MAP.get(status_code, (HavonaError, "Request failed"))
+    return exc_cls(msg, status_code, body)
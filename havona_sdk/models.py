@@ -5,11 +5,64 @@ These are plain dataclasses — no Pydantic required. Fields use snake_case
 and match what the API returns. Unknown fields are stored in `extra`.
 """
 
+import functools
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
-
-@dataclass
+if sys.version_info >= (3, 10):
+    # slots=True drops the per-instance __dict__ — noticeably less memory
+    # and faster attribute access when list() returns thousands of records
+    _dataclass = functools.partial(dataclass, slots=True)
+else:  # slots= needs 3.10; plain dataclasses on 3.9
+    _dataclass = dataclass
+
+# Known top-level keys per model, used to split `extra` off in from_dict.
+# frozensets give O(1) membership checks and are built once at import.
+_TRADE_KNOWN = frozenset((
+    "id", "contractNo", "status", "contractType", "blockchainPersistence",
+))
+_BC_STATUS_KNOWN = frozenset((
+    "connected", "chain_id", "chainId", "network",
+    "contract_address", "contractAddress",
+))
+_AGENT_KNOWN = frozenset((
+    "id", "name", "agentType", "type", "wallet", "agentWallet",
+    "status", "metadataUri", "tokenURI",
+))
+_EXTRACT_KNOWN = frozenset((
+    "documentType", "document_type", "confidence", "source",
+    "uploadedFilename", "pdfMetadata",
+))
+
+# Trade fields the extractor can return, camelCase (as the server sends)
+# mapped to their snake_case aliases.
+_TRADE_FIELD_MAP = {
+    "contractNo": "contract_no",
+    "contractType": "contract_type",
+    "commodity": "commodity",
+    "quantity": "quantity",
+    "unit": "unit",
+    "unitPrice": "unit_price",
+    "currency": "currency",
+    "totalValue": "total_value",
+    "originCountry": "origin_country",
+    "destinationCountry": "destination_country",
+    "shipmentDate": "shipment_date",
+    "paymentTerms": "payment_terms",
+    "incoterms": "incoterms",
+    "description": "description",
+}
+
+# Inverted lookup: either spelling of a field resolves to its camelCase
+# name in one dict hit. New extractor fields only need a map entry here.
+_TRADE_FIELD_ALIASES = {camel: camel for camel in _TRADE_FIELD_MAP}
+_TRADE_FIELD_ALIASES.update(
+    {snake: camel for camel, snake in _TRADE_FIELD_MAP.items()}
+)
+
+
+@_dataclass
 class Trade:
     """A TradeContract record."""
 
@@ -24,21 +77,21 @@ class Trade:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Trade":
-        bp = data.get("blockchainPersistence") or {}
+        get = data.get
+        bp = get("blockchainPersistence") or {}
         return cls(
-            id=data.get("id", ""),
-            contract_no=data.get("contractNo", ""),
-            status=data.get("status", ""),
-            contract_type=data.get("contractType"),
-            blockchain_status=bp.get("status") or data.get("blockchain_status"),
-            tx_hash=bp.get("txHash") or data.get("tx_hash"),
-            block_number=bp.get("blockNumber") or data.get("block_number"),
-            extra={k: v for k, v in data.items() if k not in
-                  ("id", "contractNo", "status", "contractType", "blockchainPersistence")},
+            id=get("id", ""),
+            contract_no=get("contractNo", ""),
+            status=get("status", ""),
+            contract_type=get("contractType"),
+            blockchain_status=bp.get("status") or get("blockchain_status"),
+            tx_hash=bp.get("txHash") or get("tx_hash"),
+            block_number=bp.get("blockNumber") or get("block_number"),
+            extra={k: v for k, v in data.items() if k not in _TRADE_KNOWN},
         )
 
 
-@dataclass
+@_dataclass(frozen=True)
 class BlockchainPersistence:
     """Blockchain persistence record for a trade or document."""
 
@@ -51,17 +104,18 @@ class BlockchainPersistence:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BlockchainPersistence":
+        get = data.get
         return cls(
-            record_id=data.get("recordId", ""),
-            status=data.get("status", ""),
-            tx_hash=data.get("txHash"),
-            block_number=data.get("blockNumber"),
-            attempt_count=data.get("attemptCount", 0),
-            created_at=data.get("createdAt"),
+            record_id=get("recordId", ""),
+            status=get("status", ""),
+            tx_hash=get("txHash"),
+            block_number=get("blockNumber"),
+            attempt_count=get("attemptCount", 0),
+            created_at=get("createdAt"),
         )
 
 
-@dataclass
+@_dataclass
 class BlockchainStatus:
     """Current blockchain connection status from the Havona server."""
 
@@ -73,18 +127,17 @@ class BlockchainStatus:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BlockchainStatus":
+        get = data.get
         return cls(
-            connected=data.get("connected", False),
-            chain_id=data.get("chain_id") or data.get("chainId"),
-            network=data.get("network"),
-            contract_address=data.get("contract_address") or data.get("contractAddress"),
-            extra={k: v for k, v in data.items()
-                   if k not in ("connected", "chain_id", "chainId", "network",
-                                "contract_address", "contractAddress")},
+            connected=get("connected", False),
+            chain_id=get("chain_id") or get("chainId"),
+            network=get("network"),
+            contract_address=get("contract_address") or get("contractAddress"),
+            extra={k: v for k, v in data.items() if k not in _BC_STATUS_KNOWN},
         )
 
 
-@dataclass
+@_dataclass
 class Agent:
     """An ERC-8004 registered agent."""
 
@@ -98,20 +151,21 @@ class Agent:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Agent":
+        # Hot loop when decoding bulk agent lists: bind data.get once so
+        # each field read is a plain call instead of an attribute lookup.
+        get = data.get
         return cls(
-            id=data.get("id", 0),
-            name=data.get("name", ""),
-            agent_type=data.get("agentType") or data.get("type", ""),
-            wallet=data.get("wallet") or data.get("agentWallet"),
-            status=data.get("status"),
-            metadata_uri=data.get("metadataUri") or data.get("tokenURI"),
-            extra={k: v for k, v in data.items()
-                   if k not in ("id", "name", "agentType", "type", "wallet",
-                                "agentWallet", "status", "metadataUri", "tokenURI")},
+            id=get("id", 0),
+            name=get("name", ""),
+            agent_type=get("agentType") or get("type", ""),
+            wallet=get("wallet") or get("agentWallet"),
+            status=get("status"),
+            metadata_uri=get("metadataUri") or get("tokenURI"),
+            extra={k: v for k, v in data.items() if k not in _AGENT_KNOWN},
         )
 
 
-@dataclass
+@_dataclass
 class AgentReputation:
     """Aggregated reputation score for an agent."""
 
@@ -130,7 +184,7 @@ class AgentReputation:
         )
 
 
-@dataclass
+@_dataclass
 class ExtractionResult:
     """Result of a document extraction (PDF, Excel, or structured input)."""
 
@@ -150,59 +204,38 @@ class ExtractionResult:
             result = client.documents.extract_pdf("invoice.pdf")
             trade = client.trades.create(**result.to_trade_fields(), status="DRAFT")
         """
-        # Normalise common field names the extractor returns
+        # Single pass: either spelling resolves through the alias table;
+        # the camelCase server key wins if both spellings are present
         payload = {}
-        field_map = {
-            "contractNo": "contract_no",
-            "contractType": "contract_type",
-            "commodity": "commodity",
-            "quantity": "quantity",
-            "unit": "unit",
-            "unitPrice": "unit_price",
-            "currency": "currency",
-            "totalValue": "total_value",
-            "originCountry": "origin_country",
-            "destinationCountry": "destination_country",
-            "shipmentDate": "shipment_date",
-            "paymentTerms": "payment_terms",
-            "incoterms": "incoterms",
-            "description": "description",
-        }
-
-        # First pass: use extracted field names as-is (camelCase from server)
-        for server_key in field_map:
-            if server_key in self.fields:
-                payload[server_key] = self.fields[server_key]
-
-        # Second pass: accept snake_case aliases
-        for server_key, snake_key in field_map.items():
-            if snake_key in self.fields and server_key not in payload:
-                payload[server_key] = self.fields[snake_key]
-
+        for key, value in self.fields.items():
+            target = _TRADE_FIELD_ALIASES.get(key)
+            if target is None:
+                continue
+            if key == target or target not in payload:
+                payload[target] = value
         return payload
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ExtractionResult":
+        get = data.get
         # Server wraps result under "extractedData" or "fields"
         fields = (
-            data.get("extractedData")
-            or data.get("fields")
-            or data.get("result")
-            or {k: v for k, v in data.items()
-                if k not in ("documentType", "document_type", "confidence",
-                             "source", "uploadedFilename", "pdfMetadata")}
+            get("extractedData")
+            or get("fields")
+            or get("result")
+            or {k: v for k, v in data.items() if k not in _EXTRACT_KNOWN}
         )
         return cls(
-            document_type=data.get("documentType") or data.get("document_type", "unknown"),
+            document_type=get("documentType") or get("document_type", "unknown"),
             fields=fields if isinstance(fields, dict) else {},
-            confidence=data.get("confidence"),
-            source=data.get("source"),
-            uploaded_filename=data.get("uploadedFilename"),
+            confidence=get("confidence"),
+            source=get("source"),
+            uploaded_filename=get("uploadedFilename"),
             raw=data,
         )
 
 
-@dataclass
+@_dataclass(frozen=True)
 class ETRType:
     """An ETR document type supported by the extraction service."""
 
@@ -1,13 +1,26 @@
-from .agents import AgentsResource
-from .blockchain import BlockchainResource
-from .documents import DocumentsResource
-from .etrs import ETRsResource
-from .trades import TradesResource
-
-__all__ = [
-    "AgentsResource",
-    "BlockchainResource",
-    "DocumentsResource",
-    "ETRsResource",
-    "TradesResource",
-]
+import importlib
+
+# Lazy (PEP 562): importing one resource must not drag in the other four.
+_LAZY_ATTRS = {
+    "AgentsResource": ".agents",
+    "BlockchainResource": ".blockchain",
+    "DocumentsResource": ".documents",
+    "ETRsResource": ".etrs",
+    "TradesResource": ".trades",
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    try:
+        module_name = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
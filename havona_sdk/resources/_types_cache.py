@@ -0,0 +1,62 @@
+"""Shared cache for the ETR type catalogue (GET /api/etr/types).
+
+DocumentsResource.supported_types and ETRsResource.types hit the same
+endpoint, and the catalogue changes rarely. Both now read through one
+per-client cache: fresh entries are served without a round-trip, and
+expired entries revalidate with ``If-None-Match`` so an unchanged
+catalogue costs a 304 instead of a re-download and re-parse.
+"""
+
+import threading
+import time
+from typing import List, Optional, TYPE_CHECKING
+
+from .. import _json
+from ..models import ETRType
+
+if TYPE_CHECKING:
+    from ..client import HavonaClient
+
+_DEFAULT_TTL = 300
+_PATH = "/api/etr/types"
+
+_lock = threading.Lock()
+
+
+def fetch(client: "HavonaClient") -> List[ETRType]:
+    """Return the ETR type catalogue, cached on the client instance.
+
+    Honors ``HavonaClient(metadata_ttl=...)``; a ttl of 0 disables the
+    freshness window but still sends ``If-None-Match`` so unchanged
+    catalogues skip the body transfer and parse.
+    """
+    ttl = getattr(client, "_metadata_ttl", _DEFAULT_TTL)
+    entry = getattr(client, "_etr_types_cache", None)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[2]
+
+    etag: Optional[str] = entry[1] if entry is not None else None
+    headers = {"If-None-Match": etag} if etag else None
+    resp = client._get(_PATH, headers=headers)
+
+    if resp.status_code == 304 and entry is not None:
+        types = entry[2]
+    else:
+        raw = _json.loads(resp.content)
+        if isinstance(raw, list):
+            items = raw
+        else:
+            # Server may return a list or a dict with a "types" key
+            items = raw.get("types") or raw.get("documentTypes") or []
+        types = [ETRType.from_dict(item) for item in items]
+        etag = resp.headers.get("ETag")
+
+    with _lock:
+        client._etr_types_cache = (time.monotonic() + ttl, etag, types)
+    return types
+
+
+def invalidate(client: "HavonaClient") -> None:
+    """Drop the cached catalogue so the next call refetches over HTTP."""
+    with _lock:
+        client._etr_types_cache = None
@@ -1,12 +1,19 @@
 """Agents resource — ERC-8004 on-chain agent registry and reputation."""
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
 
+from .. import _json
+from .._cache import ttl_cache
 from ..models import Agent, AgentReputation
 
 if TYPE_CHECKING:
     from ..client import HavonaClient
 
+# Built once: plain concatenation with these beats f-string formatting
+# when get()/get_reputation() run in tight loops over many ids.
+_BASE = "/api/agents/"
+_REP_SUFFIX = "/reputation"
+
 
 class AgentsResource:
 
@@ -15,19 +22,75 @@ class AgentsResource:
 
     def list(self) -> List[Agent]:
         """Returns an empty list if the blockchain connection is unavailable."""
-        resp = self._client._request("GET", "/api/agents")
-        data = resp.json()
-        raw_agents = data.get("agents") or []
-        return [Agent.from_dict(a) for a in raw_agents]
+        return list(self.iter())
+
+    def iter(self, batch_size: int = 100) -> Iterator[Agent]:
+        """Yield agents one at a time using server-side cursor pagination.
+
+        Fetches ``batch_size`` agents per request (``?first=N&after=<cursor>``)
+        and yields each as it is parsed, so only one page is ever held in
+        memory and callers can stop early once they find a match. Servers
+        without pagination support return the full list with no
+        ``pageInfo``, which degrades to a single-page fetch.
+        """
+        cursor: Optional[str] = None
+        while True:
+            params: Dict[str, Any] = {"first": batch_size}
+            if cursor:
+                params["after"] = cursor
+            resp = self._client._get("/api/agents", params=params)
+            # _json.loads(resp.content) hits orjson when installed — the bulk
+            # list is the hottest parse in this resource
+            data = _json.loads(resp.content)
+            for raw in data.get("agents") or []:
+                yield Agent.from_dict(raw)
+            cursor = (data.get("pageInfo") or {}).get("endCursor")
+            if not cursor:
+                break
 
     def get(self, agent_id: int) -> Agent:
-        resp = self._client._request("GET", f"/api/agents/{agent_id}")
-        return Agent.from_dict(resp.json())
+        resp = self._client._get(_BASE + str(agent_id))
+        return Agent.from_dict(_json.loads(resp.content))
 
     def get_reputation(self, agent_id: int) -> AgentReputation:
-        resp = self._client._request("GET", f"/api/agents/{agent_id}/reputation")
-        return AgentReputation.from_dict(agent_id, resp.json())
+        resp = self._client._get(_BASE + str(agent_id) + _REP_SUFFIX)
+        return AgentReputation.from_dict(agent_id, _json.loads(resp.content))
+
+    def get_reputations(
+        self,
+        agent_ids: List[int],
+        batch_size: int = 25,
+    ) -> Dict[int, AgentReputation]:
+        """
+        Fetch reputation for many agents in one GraphQL round-trip per batch.
+
+        Builds a single query with one aliased ``agentReputation`` sub-query
+        per id, so N agents cost 1 request instead of N:
+
+            reps = client.agents.get_reputations([a.id for a in agents])
+            reps[agents[0].id].average_score
+
+        ``batch_size`` caps how many ids go into one request payload.
+        """
+        results: Dict[int, AgentReputation] = {}
+
+        for start in range(0, len(agent_ids), batch_size):
+            batch = agent_ids[start:start + batch_size]
+            var_decls = ", ".join(f"$id{i}: ID!" for i in range(len(batch)))
+            selections = "\n".join(
+                f"agent{i}: agentReputation(id: $id{i}) {{ totalFeedback averageScore }}"
+                for i in range(len(batch))
+            )
+            query = f"query ({var_decls}) {{\n{selections}\n}}"
+            variables = {f"id{i}": aid for i, aid in enumerate(batch)}
+
+            data = self._client.graphql(query, variables=variables)
+            for i, aid in enumerate(batch):
+                results[aid] = AgentReputation.from_dict(aid, data.get(f"agent{i}") or {})
+
+        return results
 
+    @ttl_cache()
     def status(self) -> Dict[str, Any]:
-        resp = self._client._request("GET", "/api/agents/status")
-        return resp.json()
+        resp = self._client._get("/api/agents/status")
+        return _json.loads(resp.content)
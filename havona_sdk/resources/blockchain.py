@@ -8,13 +8,17 @@ These endpoints let you inspect the blockchain layer directly without
 needing to query the chain yourself.
 """
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
 
+from .. import _json
+from .._cache import ttl_cache
 from ..models import BlockchainPersistence, BlockchainStatus
 
 if TYPE_CHECKING:
     from ..client import HavonaClient
 
+_PERSISTENCE_BASE = "/api/blockchain/persistence/"
+
 
 class BlockchainResource:
 
@@ -22,14 +26,22 @@ class BlockchainResource:
         self._client = client
 
     def status(self) -> BlockchainStatus:
-        resp = self._client._request("GET", "/api/blockchain/status")
-        return BlockchainStatus.from_dict(resp.json())
+        # Wraps raw_status() so both views share one (cached) fetch
+        return BlockchainStatus.from_dict(self.raw_status())
+
+    def invalidate(self) -> None:
+        """Drop cached status so the next call refetches over HTTP."""
+        self.__dict__.pop("_ttl_cache", None)
 
     def get_persistence(self, record_id: str) -> BlockchainPersistence:
-        resp = self._client._request("GET", f"/api/blockchain/persistence/{record_id}")
-        return BlockchainPersistence.from_dict(resp.json())
+        resp = self._client._get(_PERSISTENCE_BASE + record_id)
+        return BlockchainPersistence.from_dict(_json.loads(resp.content))
 
+    # Pinned short TTL: this is a connectivity check, not catalogue
+    # metadata — a chain that dropped five minutes ago must not keep
+    # reporting as connected for the rest of the metadata_ttl window.
+    @ttl_cache(seconds=5)
     def raw_status(self) -> Dict[str, Any]:
         """Return the raw blockchain status dict without model parsing."""
-        resp = self._client._request("GET", "/api/blockchain/status")
-        return resp.json()
+        resp = self._client._get("/api/blockchain/status")
+        return _json.loads(resp.content)
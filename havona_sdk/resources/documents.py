@@ -5,69 +5,191 @@ Neither extraction endpoint persists anything. Call client.trades.create() with
 the result to save the data.
 """
 
+import mmap
 import os
-from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, TYPE_CHECKING
 
+from . import _types_cache
+from .. import _json
 from ..models import ETRType, ExtractionResult
 
+try:
+    # Optional: streams uploads from disk instead of buffering them whole
+    from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+except ImportError:
+    MultipartEncoder = None
+    MultipartEncoderMonitor = None
+
 if TYPE_CHECKING:
     from ..client import HavonaClient
 
+# Above this size the upload body is memory-mapped: reads come straight
+# from the OS page cache with no Python-level buffering, which pays off
+# on multi-MB scans and re-uploads of files already in cache.
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+
+class _MmapBody:
+    """File-like over an mmap for MultipartEncoder streaming.
+
+    The encoder sizes parts via ``len``; a raw mmap's ``__len__`` is the
+    constant file size, so its part never reads as consumed and the
+    encoder's write loop spins forever. This wrapper exposes only a
+    ``len`` of the bytes *remaining*, which shrinks as reads advance.
+    """
+
+    def __init__(self, mm):
+        self._mm = mm
+
+    def read(self, size: int = -1) -> bytes:
+        return self._mm.read(size)
+
+    @property
+    def len(self) -> int:
+        return len(self._mm) - self._mm.tell()
+
+    def close(self) -> None:
+        self._mm.close()
+
+
+def _upload_body(fh, size: int):
+    """Return a read body for ``fh`` — a wrapped mmap for large files, else
+    the plain handle. Caller closes the body when it differs from ``fh``."""
+    if size > _MMAP_THRESHOLD:
+        try:
+            return _MmapBody(mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ))
+        except (ValueError, OSError):
+            pass  # empty file or platform without mmap for this handle
+    return fh
+
 
 class DocumentsResource:
 
     def __init__(self, client: "HavonaClient"):
         self._client = client
+        # One boundary per resource: each MultipartEncoder otherwise draws a
+        # fresh uuid4 per upload, wasted work in bulk extraction loops.
+        self._boundary = uuid.uuid4().hex
 
     def extract(
         self,
         file_path: str,
         document_type: str,
         mode: str = "native",
+        progress: Optional[Callable] = None,
+    ) -> ExtractionResult:
+        """Extract fields from an ETR PDF (COMMERCIAL_INVOICE, BILL_OF_LADING, etc.). Nothing is saved.
+
+        With requests-toolbelt installed the PDF is streamed from disk in
+        chunks rather than buffered into memory; ``progress`` (a callable
+        receiving the encoder monitor) is then invoked as bytes go out.
+        """
+        name = os.path.basename(file_path)
+        size = os.stat(file_path).st_size
+        with open(file_path, "rb") as fh:
+            body = _upload_body(fh, size)
+            try:
+                if MultipartEncoder is not None:
+                    encoder = MultipartEncoder(fields={
+                        "file": (name, body, "application/pdf"),
+                        "document_type": document_type,
+                        "mode": mode,
+                    }, boundary=self._boundary)
+                    resp = self._client._request_streaming(
+                        "POST",
+                        "/api/etr/extract",
+                        _monitored(encoder, progress),
+                    )
+                else:
+                    files = {"file": (name, body, "application/pdf")}
+                    data = {"document_type": document_type, "mode": mode}
+                    resp = self._client._request(
+                        "POST",
+                        "/api/etr/extract",
+                        files=files,
+                        data=data,
+                    )
+            finally:
+                if body is not fh:
+                    body.close()
+        return ExtractionResult.from_dict(_json.loads(resp.content))
+
+    def extract_trade(
+        self,
+        file_path: str,
+        progress: Optional[Callable] = None,
     ) -> ExtractionResult:
-        """Extract fields from an ETR PDF (COMMERCIAL_INVOICE, BILL_OF_LADING, etc.). Nothing is saved."""
-        path = Path(file_path)
-        with open(path, "rb") as fh:
-            files = {"file": (path.name, fh, "application/pdf")}
-            data = {"document_type": document_type, "mode": mode}
-            resp = self._client._request(
-                "POST",
-                "/api/etr/extract",
-                files=files,
-                data=data,
-            )
-        return ExtractionResult.from_dict(resp.json())
-
-    def extract_trade(self, file_path: str) -> ExtractionResult:
         """Extract TradeContract fields from an unstructured document (email, PDF, Excel). Nothing is saved."""
-        path = Path(file_path)
-        with open(path, "rb") as fh:
-            content_type = _guess_content_type(path)
-            files = {"file": (path.name, fh, content_type)}
-            resp = self._client._request(
-                "POST",
-                "/api/blotting/extract-pdf",
-                files=files,
-            )
-        return ExtractionResult.from_dict(resp.json())
+        name = os.path.basename(file_path)
+        size = os.stat(file_path).st_size
+        with open(file_path, "rb") as fh:
+            content_type = _guess_content_type(name)
+            body = _upload_body(fh, size)
+            try:
+                if MultipartEncoder is not None:
+                    encoder = MultipartEncoder(fields={
+                        "file": (name, body, content_type),
+                    }, boundary=self._boundary)
+                    resp = self._client._request_streaming(
+                        "POST",
+                        "/api/blotting/extract-pdf",
+                        _monitored(encoder, progress),
+                    )
+                else:
+                    files = {"file": (name, body, content_type)}
+                    resp = self._client._request(
+                        "POST",
+                        "/api/blotting/extract-pdf",
+                        files=files,
+                    )
+            finally:
+                if body is not fh:
+                    body.close()
+        return ExtractionResult.from_dict(_json.loads(resp.content))
+
+    def extract_trade_many(
+        self,
+        file_paths: List[str],
+        max_workers: int = 8,
+    ) -> List[ExtractionResult]:
+        """Run extract_trade() over many files concurrently.
+
+        Uploads are network-bound and JSON decoding releases the GIL under
+        orjson, so a small thread pool overlaps one file's parse with the
+        next file's upload. The session's connection pool already allows
+        this much HTTP concurrency. Results come back in input order.
+        """
+        if not file_paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as pool:
+            return list(pool.map(self.extract_trade, file_paths))
 
     def supported_types(self) -> List[ETRType]:
-        resp = self._client._request("GET", "/api/etr/types")
-        raw = resp.json()
-        # Server may return a list or a dict with a "types" key
-        if isinstance(raw, list):
-            items = raw
-        else:
-            items = raw.get("types") or raw.get("documentTypes") or []
-        return [ETRType.from_dict(item) for item in items]
-
-
-def _guess_content_type(path: Path) -> str:
-    suffix = path.suffix.lower()
-    return {
-        ".pdf": "application/pdf",
-        ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        ".xls": "application/vnd.ms-excel",
-        ".csv": "text/csv",
-    }.get(suffix, "application/octet-stream")
+        """ETR type catalogue, cached per client with ETag revalidation."""
+        return _types_cache.fetch(self._client)
+
+
+def _monitored(encoder, progress: Optional[Callable]):
+    """Wrap the encoder in a MultipartEncoderMonitor when a progress
+    callback was supplied."""
+    if progress is None:
+        return encoder
+    return MultipartEncoderMonitor(encoder, progress)
+
+
+# Suffix → content type, built once; lookups fall back to octet-stream.
+_CONTENT_TYPES = {
+    ".pdf": "application/pdf",
+    ".xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    ".xls": "application/vnd.ms-excel",
+    ".csv": "text/csv",
+}
+_OCTET_STREAM = "application/octet-stream"
+
+
+def _guess_content_type(filename: str) -> str:
+    # os.path.splitext on the bare name beats constructing a Path just to
+    # read .suffix — these run once per uploaded file.
+    return _CONTENT_TYPES.get(os.path.splitext(filename)[1].lower(), _OCTET_STREAM)
@@ -2,6 +2,7 @@
 
 from typing import List, Optional, TYPE_CHECKING
 
+from . import _types_cache
 from ..models import ETRType, ExtractionResult
 
 if TYPE_CHECKING:
@@ -14,13 +15,10 @@ class ETRsResource:
         self._client = client
 
     def types(self) -> List[ETRType]:
-        resp = self._client._request("GET", "/api/etr/types")
-        raw = resp.json()
-        if isinstance(raw, list):
-            items = raw
-        else:
-            items = raw.get("types") or raw.get("documentTypes") or []
-        return [ETRType.from_dict(item) for item in items]
+        """ETR type catalogue, cached per client with ETag revalidation.
+
+        Shares one cache with client.documents.supported_types."""
+        return _types_cache.fetch(self._client)
 
     def extract(self, file_path: str, document_type: str, mode: str = "native") -> ExtractionResult:
         """Alias for client.documents.extract(). Nothing is persisted."""
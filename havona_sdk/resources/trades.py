@@ -5,14 +5,25 @@ Writes go through POST /dynamic (DGraph + blockchain).
 Reads go through POST /graphql.
 """
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import functools
+import re
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, TYPE_CHECKING
 
+from .. import _json, _schemas
+from ..exceptions import NotFoundError
 from ..models import Trade
 
 if TYPE_CHECKING:
     from ..client import HavonaClient
 
-_TRADE_FIELDS = """
+# Collapsed to one line at import so every list/get/iter payload skips the
+# indentation bytes, and interned so repeat queries share one string object.
+_TRADE_FIELDS = sys.intern(re.sub(r"\s+", " ", """
     id
     contractNo
     status
@@ -25,31 +36,128 @@ _TRADE_FIELDS = """
         blockNumber
         attemptCount
     }
-"""
+""").strip())
+
+
+# Parameterized so the server parses each query shape once and the id/paging
+# values travel as GraphQL variables instead of being spliced into the text.
+# Cached per field selection — custom `fields` callers pay the format once.
+@functools.lru_cache(maxsize=32)
+def _page_query(fields: str) -> str:
+    return (
+        "query Page($first: Int!, $offset: Int!) "
+        "{ queryTradeContract(first: $first, offset: $offset) { %s } }" % fields
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _list_query(fields: str) -> str:
+    return "query List($first: Int!) { queryTradeContract(first: $first) { %s } }" % fields
+
+
+@functools.lru_cache(maxsize=32)
+def _get_query(fields: str) -> str:
+    return "query Get($id: ID!) { getTradeContract(id: $id) { %s } }" % fields
+
+
+_TRADE_CACHE_MAX = 1024
 
 
 class TradesResource:
     def __init__(self, client: "HavonaClient"):
         self._client = client
+        # Parsed-Trade LRU keyed on (id, updatedAt). Scoped to this resource
+        # so clients pointed at different servers or tenants can never see
+        # each other's records. Rows without a version (the default field
+        # selection does not request updatedAt) parse as before.
+        self._trade_cache: "OrderedDict[tuple, Trade]" = OrderedDict()
+        self._trade_cache_lock = threading.Lock()
+
+    def _trade_from_row(self, raw: Dict[str, Any]) -> Trade:
+        version = raw.get("updatedAt")
+        if not version:
+            return Trade.from_dict(raw)
+        key = (raw.get("id"), version)
+        with self._trade_cache_lock:
+            cached = self._trade_cache.get(key)
+            if cached is not None:
+                self._trade_cache.move_to_end(key)
+        if cached is None:
+            cached = Trade.from_dict(raw)
+            with self._trade_cache_lock:
+                self._trade_cache[key] = cached
+                if len(self._trade_cache) > _TRADE_CACHE_MAX:
+                    self._trade_cache.popitem(last=False)
+        # Trade is mutable — hand each caller its own copy (with its own
+        # extra dict) so nobody can mutate the cached instance.
+        return replace(cached, extra=dict(cached.extra))
+
+    def _evict_trade(self, trade_id: str) -> None:
+        with self._trade_cache_lock:
+            for key in [k for k in self._trade_cache if k[0] == trade_id]:
+                del self._trade_cache[key]
 
     def list(self, limit: int = 100, fields: Optional[str] = None) -> List[Trade]:
-        gql_fields = fields or _TRADE_FIELDS
+        """Fetch up to ``limit`` trades with exactly one request. For lazy
+        paging over larger sets use :meth:`iter`."""
         data = self._client.graphql(
-            f"query {{ queryTradeContract(first: {limit}) {{ {gql_fields} }} }}"
+            _list_query(fields or _TRADE_FIELDS), variables={"first": limit}
         )
-        return [Trade.from_dict(r) for r in data.get("queryTradeContract") or []]
+        return [self._trade_from_row(raw) for raw in data.get("queryTradeContract") or []]
 
-    def get(self, trade_id: str, fields: Optional[str] = None) -> Trade:
-        from ..exceptions import NotFoundError
+    def iter(
+        self,
+        page_size: int = 50,
+        prefetch: int = 1,
+        fields: Optional[str] = None,
+    ) -> Iterator[Trade]:
+        """
+        Iterate all trades, paging server-side and prefetching the next page
+        in a background thread while the caller consumes the current one:
+
+            for trade in client.trades.iter(page_size=50):
+                process(trade)
+
+        Effective throughput becomes max(network, processing) instead of
+        their sum. Iteration stops on the first short or empty page.
+        """
+        query = _page_query(fields or _TRADE_FIELDS)
+
+        def fetch_page(offset: int) -> List[Dict[str, Any]]:
+            data = self._client.graphql(
+                query, variables={"first": page_size, "offset": offset}
+            )
+            return data.get("queryTradeContract") or []
+
+        executor = ThreadPoolExecutor(max_workers=prefetch + 1)
+        try:
+            offset = 0
+            future = executor.submit(fetch_page, offset)
+            while True:
+                page = future.result()
+                if not page:
+                    break
+                if len(page) == page_size:
+                    # Kick off the next page before yielding this one
+                    offset += page_size
+                    future = executor.submit(fetch_page, offset)
+                else:
+                    future = None
+                for raw in page:
+                    yield self._trade_from_row(raw)
+                if future is None:
+                    break
+        finally:
+            executor.shutdown(wait=False)
 
-        gql_fields = fields or _TRADE_FIELDS
+    def get(self, trade_id: str, fields: Optional[str] = None) -> Trade:
         data = self._client.graphql(
-            f'query {{ getTradeContract(id: "{trade_id}") {{ {gql_fields} }} }}'
+            _get_query(fields or _TRADE_FIELDS), variables={"id": trade_id}
         )
         raw = data.get("getTradeContract")
         if raw is None:
             raise NotFoundError(f"TradeContract '{trade_id}' not found")
-        return Trade.from_dict(raw)
+        return self._trade_from_row(raw)
 
     def create(self, **kwargs: Any) -> Trade:
         """
@@ -65,9 +173,67 @@ class TradesResource:
         result = self._client.write("TradeContract", _normalise_fields(kwargs))
         return Trade.from_dict(result)
 
+    def create_many(
+        self,
+        trades: List[Dict[str, Any]],
+        batch_size: int = 25,
+    ) -> List[Trade]:
+        """
+        Create many TradeContracts with one GraphQL mutation per batch.
+
+        Each item is a dict of fields as accepted by create(). Aliased
+        addTradeContract selections put up to ``batch_size`` creates into a
+        single request, so a bulk load costs ceil(N / batch_size)
+        round-trips instead of N:
+
+            created = client.trades.create_many([
+                {"contract_no": "TC-001", "status": "DRAFT"},
+                {"contract_no": "TC-002", "status": "DRAFT"},
+            ])
+
+        Returns the created trades in input order.
+        """
+        payloads = [_normalise_fields(item) for item in trades]
+        for payload in payloads:
+            _schemas.validate("TradeContract", payload)
+
+        created: List[Trade] = []
+        for start in range(0, len(payloads), batch_size):
+            batch = payloads[start:start + batch_size]
+            var_decls = ", ".join(
+                f"$input{i}: AddTradeContractInput!" for i in range(len(batch))
+            )
+            selections = "\n".join(
+                f"m{i}: addTradeContract(input: $input{i}) {{ id contractNo status }}"
+                for i in range(len(batch))
+            )
+            mutation = f"mutation ({var_decls}) {{\n{selections}\n}}"
+            variables = {f"input{i}": payload for i, payload in enumerate(batch)}
+
+            data = self._client.graphql(mutation, variables=variables)
+            created.extend(
+                Trade.from_dict(data.get(f"m{i}") or {}) for i in range(len(batch))
+            )
+        return created
+
+    def batch_create(self, trades: List[Dict[str, Any]]) -> List[Trade]:
+        """
+        Create many TradeContracts over /dynamic with one pre-bound writer.
+
+        Unlike :meth:`create_many` (one aliased GraphQL mutation per batch),
+        each item here is its own POST — use this when the server should
+        treat the inserts independently (partial failure stops at the bad
+        item instead of rejecting the whole batch). The writer resolves the
+        URL and encoder once, and keep-alive reuses one connection across
+        the loop.
+        """
+        write = self._client.writer("TradeContract")
+        return [Trade.from_dict(write(_normalise_fields(item))) for item in trades]
+
     def update(self, trade_id: str, **kwargs: Any) -> Dict[str, Any]:
         payload = _normalise_fields(kwargs)
         payload["id"] = trade_id
+        self._evict_trade(trade_id)
         return self._client.write("TradeContract", payload)
 
     def assign_book(self, trade_id: str, book: str) -> Dict[str, Any]:
@@ -78,22 +244,30 @@ class TradesResource:
             f"/api/trades/{trade_id}/book",
             json={"book": book},
         )
-        return resp.json()
+        return _json.loads(resp.content)
+
+
+# snake_case → camelCase for common TradeContract fields; built once so
+# bulk create loops don't rebuild the mapping per payload.
+_FIELD_MAP = {
+    "contract_no": "contractNo",
+    "contract_type": "contractType",
+    "seller_id": "sellerId",
+    "buyer_id": "buyerId",
+    "blockchain_status": "blockchainStatus",
+    "payment_terms": "paymentTerms",
+    "shipment_date": "shipmentDate",
+    "origin_country": "originCountry",
+    "destination_country": "destinationCountry",
+    "unit_price": "unitPrice",
+    "total_value": "totalValue",
+}
 
 
 def _normalise_fields(kwargs: Dict[str, Any]) -> Dict[str, Any]:
     """snake_case → camelCase for common TradeContract fields."""
-    _map = {
-        "contract_no": "contractNo",
-        "contract_type": "contractType",
-        "seller_id": "sellerId",
-        "buyer_id": "buyerId",
-        "blockchain_status": "blockchainStatus",
-        "payment_terms": "paymentTerms",
-        "shipment_date": "shipmentDate",
-        "origin_country": "originCountry",
-        "destination_country": "destinationCountry",
-        "unit_price": "unitPrice",
-        "total_value": "totalValue",
-    }
+    _map = _FIELD_MAP
+    if not any(k in _map for k in kwargs):
+        # Nothing to rename — skip the copy entirely
+        return kwargs
     return {_map.get(k, k): v for k, v in kwargs.items()}